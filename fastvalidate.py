@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Batch pre-filtering of candidate usernames for wordlist-driven searches
+
+Candidates are concatenated into one byte buffer and scanned in a single
+Numba-compiled call when numba is installed; otherwise an equivalent
+regular expression is used.
+"""
+
+import re
+from typing import List
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # optional: fall back to the regex validator
+    np = None
+    njit = None
+
+GITHUB_USERNAME_MAX = 39
+
+# Alphanumerics and single hyphens, not leading or trailing, max 39 chars
+_GITHUB_USERNAME_RE = re.compile(r'[A-Za-z0-9](?:[A-Za-z0-9]|-(?=[A-Za-z0-9])){0,38}')
+
+
+def _scan_github_usernames(buf, offsets, out):
+    """
+    Check concatenated ASCII candidates against GitHub's username rules
+
+    Args:
+        buf: uint8 array holding every candidate back to back
+        offsets: int64 array of len(out) + 1 candidate boundaries in buf
+        out: bool array receiving one verdict per candidate
+    """
+    for k in range(len(out)):
+        start = offsets[k]
+        end = offsets[k + 1]
+        n = end - start
+        ok = 1 <= n <= GITHUB_USERNAME_MAX
+        prev_hyphen = True  # rejects a leading hyphen
+        i = start
+        while ok and i < end:
+            c = buf[i]
+            if c == 45:  # '-'
+                if prev_hyphen:
+                    ok = False
+                prev_hyphen = True
+            elif 48 <= c <= 57 or 65 <= c <= 90 or 97 <= c <= 122:
+                prev_hyphen = False
+            else:
+                ok = False
+            i += 1
+        out[k] = ok and not prev_hyphen
+
+
+if njit is not None:
+    _scan_batch = njit(cache=True)(_scan_github_usernames)
+else:
+    _scan_batch = None
+
+
+def filter_usernames(candidates: List[str]) -> List[str]:
+    """
+    Drop candidates that cannot be valid GitHub usernames
+
+    Args:
+        candidates: Usernames to check
+
+    Returns:
+        Valid candidates, in input order
+    """
+    if _scan_batch is None or not candidates:
+        return [name for name in candidates if _GITHUB_USERNAME_RE.fullmatch(name)]
+
+    # Non-ASCII characters become '?', which the scanner rejects anyway
+    encoded = [name.encode('ascii', 'replace') for name in candidates]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)),
+              out=offsets[1:])
+    buf = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    verdicts = np.empty(len(encoded), dtype=np.bool_)
+    _scan_batch(buf, offsets, verdicts)
+    return [name for name, ok in zip(candidates, verdicts.tolist()) if ok]
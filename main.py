@@ -6,78 +6,545 @@ Main entry point for the OSINT framework with ethical and legal capabilities
 """
 
 import argparse
+import asyncio
 import sys
 import json
+import hashlib
 import logging
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from collections import OrderedDict
+from functools import partial
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import InsecureRequestWarning
+from urllib3.util.retry import Retry
 import ssl
 import warnings
 from datetime import datetime
 from urllib.parse import quote
-from typing import Dict, List, Any
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping
 
-# Suppress SSL warnings for development (use with caution)
-warnings.filterwarnings('ignore', message='Unverified HTTPS request')
+try:
+    import aiohttp
+except ImportError:  # optional: probes fall back to threaded requests
+    aiohttp = None
+
+try:
+    import aiodns
+except ImportError:  # optional: aiohttp uses its threaded resolver instead
+    aiodns = None
+
+try:
+    import httpx
+except ImportError:  # optional: AsyncOSINTSearcher falls back to requests
+    httpx = None
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used instead
+    orjson = None
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# Shared read-only results for the common request failures
+_ERR_TIMEOUT = MappingProxyType({'status': 'error', 'error': 'Request timeout'})
+_ERR_CONNECTION = MappingProxyType({'status': 'error', 'error': 'Connection failed'})
+_ERR_HTTP = MappingProxyType({'status': 'error', 'error': 'HTTP Error'})
+
+# Failure classes of every HTTP client in use, checked in this order
+_TIMEOUT_ERRORS = (requests.exceptions.Timeout, asyncio.TimeoutError)
+_HTTP_ERRORS = (requests.exceptions.HTTPError,)
+_CONNECTION_ERRORS = (requests.exceptions.ConnectionError,)
+if aiohttp is not None:
+    _HTTP_ERRORS += (aiohttp.ClientResponseError,)
+    _CONNECTION_ERRORS += (aiohttp.ClientConnectionError,)
+if httpx is not None:
+    _TIMEOUT_ERRORS += (httpx.TimeoutException,)
+    _HTTP_ERRORS += (httpx.HTTPStatusError,)
+    _CONNECTION_ERRORS += (httpx.TransportError,)
+
+_INSECURE_FILTER = ('ignore', None, InsecureRequestWarning, None, 0)
+_insecure_lock = threading.Lock()
+_insecure_users = 0
+_insecure_added = False
+
+
+@contextmanager
+def _suppress_insecure_warning():
+    """
+    Ignore InsecureRequestWarning while any unverified request is in flight
+    
+    warnings.catch_warnings() saves and restores the whole filter list, which
+    races when requests run on several threads. Instead a single filter entry
+    is shared by reference count and removed when the last request finishes.
+    """
+    global _insecure_users, _insecure_added
+    with _insecure_lock:
+        if _insecure_users == 0:
+            # Leave a caller's own identical filter alone
+            _insecure_added = _INSECURE_FILTER not in warnings.filters
+            if _insecure_added:
+                warnings.filterwarnings('ignore', category=InsecureRequestWarning)
+        _insecure_users += 1
+    try:
+        yield
+    finally:
+        with _insecure_lock:
+            _insecure_users -= 1
+            if _insecure_users == 0 and _insecure_added:
+                try:
+                    warnings.filters.remove(_INSECURE_FILTER)
+                except ValueError:  # filters were reset in the meantime
+                    pass
+                _insecure_added = False
+
+
+def _in_running_loop() -> bool:
+    """Whether the caller is already inside a running asyncio event loop"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize read-only mappings such as the shared _ERR_* results"""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize obj as 2-space indented UTF-8 JSON, using orjson if available"""
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=_json_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default).encode('utf-8')
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode a raw JSON response body, using orjson if available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _error_result(url: str, e: Exception) -> Mapping[str, Any]:
+    """Log a failed request (requests, aiohttp or httpx) and map it to a result"""
+    if isinstance(e, _TIMEOUT_ERRORS):
+        logger.error("Timeout error for %s", url)
+        return _ERR_TIMEOUT
+    if isinstance(e, _HTTP_ERRORS):
+        logger.error("HTTP error: %s", e)
+        return _ERR_HTTP
+    if isinstance(e, _CONNECTION_ERRORS):
+        logger.error("Connection error for %s", url)
+        return _ERR_CONNECTION
+    logger.error("Unexpected error: %s", e)
+    return {'status': 'error', 'error': str(e)}
+
+
+def _build_result(raw: tuple, parse: str) -> Dict[str, Any]:
+    """Turn a raw (code, body, header items) response into a result dict"""
+    code, body, headers = raw
+    result = {
+        'status': 'success',
+        'code': code
+    }
+    if headers is not None:
+        result['headers'] = dict(headers)
+    if parse == 'json':
+        result['content'] = _json_loads(body)
+    elif parse == 'text':
+        result['content'] = body
+    return result
+
+
+class _ResponseMemo:
+    """Thread-safe bounded LRU of raw successful responses"""
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        """Return the memoized value for key, or None"""
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+    
+    def put(self, key, value):
+        """Memoize value, evicting the least recently used entry when full"""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self):
+        """Drop every memoized response"""
+        with self._lock:
+            self._data.clear()
+
+
+def _compile_url_builder(template: str):
+    """
+    Specialize a one-placeholder URL template into a concatenating builder
+    
+    Args:
+        template: URL containing a single '{}' placeholder
+        
+    Returns:
+        Callable mapping an already-quoted username to the full URL
+    """
+    if template.count('{}') != 1:
+        raise ValueError(f"URL template needs exactly one '{{}}': {template}")
+    prefix, _, suffix = template.partition('{}')
+    return lambda quoted: prefix + quoted + suffix
+
 
 class OSINTSearcher:
     """Main OSINT searcher class for gathering intelligence ethically"""
     
-    def __init__(self, verify_ssl=True):
-        """Initialize the searcher with safe configurations"""
+    CACHE_PREFIX = 'osintaam:'
+    TXT_RULE = "=" * 50 + "\n"
+    PROBE_CONCURRENCY = 32
+    PARSE_MODES = ('none', 'json', 'text')
+    MEMO_SIZE = 1024
+    DRAIN_LIMIT = 64 * 1024
+    PLATFORM_TEMPLATES = (
+        ('github', 'https://api.github.com/users/{}'),
+        ('linkedin', 'https://www.linkedin.com/in/{}'),
+    )
+    
+    def __init__(self, verify_ssl=True, cache_client=None, cache_ttl=3600):
+        """
+        Initialize the searcher with safe configurations
+        
+        Args:
+            verify_ssl: Verify TLS certificates
+            cache_client: Optional redis.Redis-compatible client used to
+                memoize successful responses across runs
+            cache_ttl: Cache entry lifetime in seconds
+        """
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                raise_on_status=False
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Connection': 'keep-alive',
+            'Accept-Encoding': 'gzip, deflate'
         })
         self.results = {}
         self.search_timestamp = datetime.now().isoformat()
         self.verify_ssl = verify_ssl
+        self.cache = cache_client
+        self.cache_ttl = cache_ttl
+        self._memo = _ResponseMemo(self.MEMO_SIZE)
+        self._builders = {
+            platform: _compile_url_builder(template)
+            for platform, template in self.PLATFORM_TEMPLATES
+        }
         
-    def safe_request(self, url: str, timeout: int = 10) -> Dict[str, Any]:
+    def close(self):
+        """Release pooled connections and the in-process response memo"""
+        self._memo.clear()
+        self.session.close()
+    
+    def _new_aiohttp_session(self):
+        """Create an aiohttp session; must be called inside the running loop"""
+        connector = aiohttp.TCPConnector(
+            limit=64,
+            limit_per_host=8,
+            resolver=aiohttp.AsyncResolver() if aiodns is not None else None,
+            use_dns_cache=True,
+            ttl_dns_cache=600,
+            ssl=None if self.verify_ssl else False
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers={'User-Agent': self.session.headers['User-Agent']}
+        )
+    
+    def safe_request(self, url: str, timeout: int = 10, parse: str = 'text',
+                     include_headers: bool = False) -> Mapping[str, Any]:
         """
         Make safe HTTP requests with error handling
         
         Args:
             url: URL to request
             timeout: Request timeout in seconds
+            parse: Body handling - 'text' (str content), 'json' (decoded
+                content) or 'none' (status and headers only; bodies up to
+                DRAIN_LIMIT are read and discarded to keep the connection)
+            include_headers: Copy the response headers into the result
             
         Returns:
-            Dictionary with response data or error info
+            Dictionary with response data, or a shared read-only error
+            mapping (copy with dict() before mutating)
         """
+        if parse not in self.PARSE_MODES:
+            raise ValueError(f"Unknown parse mode: {parse}")
+        key = (url, timeout, parse, include_headers)
         try:
-            logger.info(f"Requesting: {url}")
-            response = self.session.get(
-                url,
-                timeout=timeout,
-                verify=self.verify_ssl,
-                allow_redirects=True
-            )
+            raw = self._memo.get(key)
+            if raw is None:
+                raw = self._fetch(url, timeout, parse, include_headers)
+                self._memo.put(key, raw)
+            return _build_result(raw, parse)
+        except Exception as e:
+            return _error_result(url, e)
+    
+    def _should_drain(self, content_length) -> bool:
+        """
+        Whether an unwanted body is small enough to read and discard
+        
+        Closing a response with unread body drops its connection instead of
+        returning it to the pool, which costs a new TCP+TLS handshake. Small
+        bodies of known length are cheaper to read; large or unknown-length
+        ones are still abandoned.
+        """
+        try:
+            return int(content_length) <= self.DRAIN_LIMIT
+        except (TypeError, ValueError):
+            return False
+    
+    def _fetch(self, url: str, timeout: int, parse: str, include_headers: bool) -> tuple:
+        """
+        Perform the GET behind safe_request
+        
+        Failures propagate as exceptions, so only successful responses reach
+        the per-instance memo shared with the async probes. The JSON body is
+        kept as raw bytes and decoded per call so callers never share a
+        mutable object.
+        
+        Returns:
+            Tuple of (status code, body or None, header items or None)
+        """
+        logger.info("Requesting: %s", url)
+        get = partial(
+            self.session.get,
+            url,
+            timeout=timeout,
+            verify=self.verify_ssl,
+            allow_redirects=True,
+            stream=parse == 'none'
+        )
+        if self.verify_ssl:
+            response = get()
+        else:
+            with _suppress_insecure_warning():
+                response = get()
+        with response:
+            if parse == 'none' and self._should_drain(response.headers.get('Content-Length')):
+                response.content  # consume so the connection returns to the pool
             response.raise_for_status()
-            return {
-                'status': 'success',
-                'code': response.status_code,
-                'content': response.text,
-                'headers': dict(response.headers)
-            }
-        except requests.exceptions.Timeout:
-            logger.error(f"Timeout error for {url}")
-            return {'status': 'error', 'error': 'Request timeout'}
-        except requests.exceptions.ConnectionError:
-            logger.error(f"Connection error for {url}")
-            return {'status': 'error', 'error': 'Connection failed'}
-        except requests.exceptions.HTTPError as e:
-            logger.error(f"HTTP error: {e}")
-            return {'status': 'error', 'error': f'HTTP Error'}
+            if parse == 'json':
+                body = response.content
+            elif parse == 'text':
+                body = response.text
+            else:
+                body = None
+            headers = tuple(response.headers.items()) if include_headers else None
+            return response.status_code, body, headers
+    
+    def _cache_key(self, url: str, **options) -> str:
+        """Build the cache key for a URL fetched with the given request options"""
+        material = f"{sorted(options.items())}:{url}"
+        digest = hashlib.blake2b(material.encode(), digest_size=16).hexdigest()
+        return self.CACHE_PREFIX + digest
+    
+    def _cache_load(self, url: str, **options):
+        """Return a cached response for url, or None on miss"""
+        if self.cache is None:
+            return None
+        try:
+            val = self.cache.get(self._cache_key(url, **options))
+            if val is None:
+                return None
+            return json.loads(zlib.decompress(val))
         except Exception as e:
-            logger.error(f"Unexpected error: {str(e)}")
-            return {'status': 'error', 'error': str(e)}
+            logger.warning("Cache read failed for %s: %s", url, e)
+            return None
+    
+    def _cache_store(self, url: str, response: Mapping[str, Any],
+                     ttl: int = None, **options):
+        """Cache a successful response; errors are never cached"""
+        if self.cache is None or response.get('status') != 'success':
+            return
+        try:
+            self.cache.setex(
+                self._cache_key(url, **options),
+                ttl if ttl is not None else self.cache_ttl,
+                zlib.compress(json.dumps(response).encode())
+            )
+        except Exception as e:
+            logger.warning("Cache write failed for %s: %s", url, e)
+    
+    def _cached_get(self, url: str, ttl: int = None, **options) -> Mapping[str, Any]:
+        """
+        safe_request memoized through the optional cache client
+        
+        Args:
+            url: URL to request
+            ttl: Cache entry lifetime in seconds (defaults to cache_ttl)
+            **options: parse / include_headers, see safe_request
+            
+        Returns:
+            Dictionary with response data or error info
+        """
+        response = self._cache_load(url, **options)
+        if response is None:
+            response = self.safe_request(url, **options)
+            self._cache_store(url, response, ttl, **options)
+        return response
+    
+    async def _afetch(self, fetch_raw, url: str, timeout: int = 10,
+                      parse: str = 'text', include_headers: bool = False) -> Mapping[str, Any]:
+        """
+        Async counterpart of safe_request, used for concurrent probes
+        
+        Shares safe_request's in-process memo, so a URL is fetched once per
+        searcher whichever client path serves it.
+        
+        Args:
+            fetch_raw: Client-specific coroutine function taking (url, timeout,
+                parse, include_headers) and returning a raw response tuple
+            url: URL to request
+            timeout: Request timeout in seconds
+            parse: Body handling, see safe_request
+            include_headers: Copy the response headers into the result
+            
+        Returns:
+            Dictionary with response data, or a shared read-only error
+            mapping (copy with dict() before mutating)
+        """
+        if parse not in self.PARSE_MODES:
+            raise ValueError(f"Unknown parse mode: {parse}")
+        key = (url, timeout, parse, include_headers)
+        try:
+            raw = self._memo.get(key)
+            if raw is None:
+                raw = await fetch_raw(url, timeout, parse, include_headers)
+                self._memo.put(key, raw)
+            return _build_result(raw, parse)
+        except Exception as e:
+            return _error_result(url, e)
+    
+    async def _afetch_raw(self, session, url: str, timeout: int, parse: str,
+                          include_headers: bool) -> tuple:
+        """
+        Perform one GET over an aiohttp session, raising on failure
+        
+        Returns:
+            Tuple of (status code, body or None, header items or None)
+        """
+        logger.info("Requesting: %s", url)
+        async with session.get(
+            url,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+            allow_redirects=True
+        ) as response:
+            if parse == 'none' and self._should_drain(response.content_length):
+                await response.read()
+            response.raise_for_status()
+            if parse == 'json':
+                body = await response.read()
+            elif parse == 'text':
+                body = await response.text()
+            else:
+                body = None
+            headers = tuple(response.headers.items()) if include_headers else None
+            return response.status, body, headers
+    
+    async def _probe_with_aiohttp(self, platforms: Dict[str, str],
+                                  **options) -> Dict[str, Mapping[str, Any]]:
+        """
+        Probe platforms over an aiohttp session scoped to this call
+        
+        Each sync search runs this under its own asyncio.run(), so a searcher
+        shared between threads never contends for a loop, and the session is
+        closed before the call returns.
+        """
+        async with self._new_aiohttp_session() as session:
+            return await self._probe_platforms(
+                partial(self._afetch_raw, session), platforms, **options
+            )
+    
+    async def _probe_platforms(self, fetch_raw, platforms: Dict[str, str],
+                               **options) -> Dict[str, Mapping[str, Any]]:
+        """
+        Fetch all platform URLs concurrently, skipping cache hits
+        
+        The cache client is synchronous, so its calls run in the default
+        executor rather than blocking the event loop.
+        
+        Args:
+            fetch_raw: Client-specific raw fetcher handed to _afetch
+            platforms: Mapping of platform name to URL
+            **options: parse / include_headers, see safe_request
+            
+        Returns:
+            Mapping of platform name to safe_request-style response
+        """
+        loop = asyncio.get_running_loop()
+        if self.cache is not None:
+            cached_responses = await asyncio.gather(*[
+                loop.run_in_executor(None, partial(self._cache_load, url, **options))
+                for url in platforms.values()
+            ])
+        else:
+            cached_responses = [None] * len(platforms)
+        
+        results = {}
+        pending = {}
+        for (platform, url), cached in zip(platforms.items(), cached_responses):
+            if cached is None:
+                pending[platform] = url
+            else:
+                results[platform] = cached
+        
+        if pending:
+            sem = asyncio.Semaphore(self.PROBE_CONCURRENCY)
+            
+            async def bounded_fetch(url):
+                async with sem:
+                    return await self._afetch(fetch_raw, url, **options)
+            
+            tasks = [bounded_fetch(url) for url in pending.values()]
+            responses = await asyncio.gather(*tasks, return_exceptions=True)
+            stores = []
+            for (platform, url), response in zip(pending.items(), responses):
+                if isinstance(response, BaseException):
+                    response = {'status': 'error', 'error': str(response)}
+                if self.cache is not None:
+                    stores.append(loop.run_in_executor(
+                        None, partial(self._cache_store, url, response, **options)
+                    ))
+                results[platform] = response
+            await asyncio.gather(*stores)
+        return results
     
     def search_email_breach(self, email: str) -> Dict[str, Any]:
         """
@@ -89,7 +556,7 @@ class OSINTSearcher:
         Returns:
             Dictionary with breach information
         """
-        logger.info(f"Searching for email breaches: {email}")
+        logger.info("Searching for email breaches: %s", email)
         results = {
             'email': email,
             'breaches': [],
@@ -100,31 +567,47 @@ class OSINTSearcher:
         logger.info("Email breach search completed using public sources")
         return results
     
-    def search_username(self, username: str) -> Dict[str, Any]:
+    def _username_platforms(self, username: str) -> Dict[str, str]:
+        """Build the probe URL for every platform"""
+        quoted = quote(username, safe='')
+        return {
+            platform: build(quoted)
+            for platform, build in self._builders.items()
+        }
+    
+    def _probe_threaded(self, platforms: Dict[str, str],
+                        **options) -> Dict[str, Mapping[str, Any]]:
         """
-        Search for username across multiple platforms
+        Fetch all platform URLs on a thread pool over the requests session
         
         Args:
-            username: Username to search
+            platforms: Mapping of platform name to URL
+            **options: parse / include_headers, see safe_request
             
         Returns:
-            Dictionary with platform presence information
+            Mapping of platform name to safe_request-style response
         """
-        logger.info(f"Searching for username: {username}")
+        if not platforms:
+            return {}
+        if logger.isEnabledFor(logging.INFO):
+            for platform in platforms:
+                logger.info("Checking %s...", platform)
+        with ThreadPoolExecutor(max_workers=min(16, len(platforms))) as ex:
+            return dict(zip(platforms, ex.map(
+                lambda url: self._cached_get(url, **options),
+                platforms.values()
+            )))
+    
+    def _username_results(self, username: str, platforms: Dict[str, str],
+                          responses: Dict[str, Mapping[str, Any]]) -> Dict[str, Any]:
+        """Assemble search_username results from per-platform responses"""
         results = {
             'username': username,
             'platforms': {},
             'search_date': self.search_timestamp
         }
-        
-        platforms = {
-            'github': f'https://api.github.com/users/{username}',
-            'linkedin': f'https://www.linkedin.com/in/{username}',
-        }
-        
         for platform, url in platforms.items():
-            logger.info(f"Checking {platform}...")
-            response = self.safe_request(url)
+            response = responses[platform]
             if response['status'] == 'success':
                 results['platforms'][platform] = {
                     'found': True,
@@ -136,9 +619,34 @@ class OSINTSearcher:
                     'found': False,
                     'error': response.get('error', 'Unknown error')
                 }
-        
         return results
     
+    def search_username(self, username: str) -> Dict[str, Any]:
+        """
+        Search for username across multiple platforms
+        
+        Platforms are probed concurrently, with aiohttp when it is
+        installed and with a thread pool over the requests session otherwise.
+        The thread pool is also used when called from inside a running event
+        loop (Jupyter, async apps), where the private loop cannot run; use
+        AsyncOSINTSearcher there to stay on the caller's loop.
+        
+        Args:
+            username: Username to search
+            
+        Returns:
+            Dictionary with platform presence information
+        """
+        logger.info("Searching for username: %s", username)
+        platforms = self._username_platforms(username)
+        if aiohttp is not None and not _in_running_loop():
+            responses = asyncio.run(self._probe_with_aiohttp(
+                platforms, parse='none', include_headers=False
+            ))
+        else:
+            responses = self._probe_threaded(platforms, parse='none', include_headers=False)
+        return self._username_results(username, platforms, responses)
+    
     def search_domain_info(self, domain: str) -> Dict[str, Any]:
         """
         Gather public information about a domain
@@ -149,7 +657,7 @@ class OSINTSearcher:
         Returns:
             Dictionary with domain information
         """
-        logger.info(f"Searching domain information: {domain}")
+        logger.info("Searching domain information: %s", domain)
         results = {
             'domain': domain,
             'information': {},
@@ -170,7 +678,7 @@ class OSINTSearcher:
         Returns:
             Dictionary with breach information
         """
-        logger.info(f"Searching for phone in breaches: {phone}")
+        logger.info("Searching for phone in breaches: %s", phone)
         results = {
             'phone': phone,
             'breaches_found': False,
@@ -192,7 +700,7 @@ class OSINTSearcher:
         Returns:
             Dictionary with findings from monitored sources
         """
-        logger.info(f"Monitoring public Tor-related sources for: {query}")
+        logger.info("Monitoring public Tor-related sources for: %s", query)
         results = {
             'query': query,
             'tor_monitoring': {
@@ -211,28 +719,39 @@ class OSINTSearcher:
         logger.info("Tor monitoring completed using legitimate aggregators")
         return results
     
+    def _export_bytes(self, format: str = 'json') -> bytes:
+        """
+        Export search results as UTF-8 encoded bytes
+        
+        Args:
+            format: Export format (json, txt)
+            
+        Returns:
+            Encoded results
+        """
+        body = _json_dumps(self.results)
+        if format.lower() == 'txt':
+            header = ''.join([
+                self.TXT_RULE,
+                "OSINTAAM Search Results\n",
+                f"Generated: {self.search_timestamp}\n",
+                self.TXT_RULE,
+                "\n"
+            ]).encode('utf-8')
+            return header + body + b"\n"
+        return body
+    
     def export_results(self, format: str = 'json') -> str:
         """
         Export search results in specified format
         
         Args:
-            format: Export format (json, csv, txt)
+            format: Export format (json, txt)
             
         Returns:
             Formatted string of results
         """
-        if format.lower() == 'json':
-            return json.dumps(self.results, indent=2, ensure_ascii=False)
-        elif format.lower() == 'txt':
-            output = "="*50 + "\n"
-            output += "OSINTAAM Search Results\n"
-            output += f"Generated: {self.search_timestamp}\n"
-            output += "="*50 + "\n"
-            for key, value in self.results.items():
-                output += f"\n{key.upper()}:\n{json.dumps(value, indent=2, ensure_ascii=False)}\n"
-            return output
-        else:
-            return json.dumps(self.results, indent=2, ensure_ascii=False)
+        return self._export_bytes(format).decode('utf-8')
     
     def save_results(self, filename: str, format: str = 'json'):
         """
@@ -243,15 +762,129 @@ class OSINTSearcher:
             format: File format
         """
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(self.export_results(format))
-            logger.info(f"Results saved to {filename}")
+            with open(filename, 'wb') as f:
+                f.write(self._export_bytes(format))
+            logger.info("Results saved to %s", filename)
         except IOError as e:
-            logger.error(f"Could not save results: {e}")
+            logger.error("Could not save results: %s", e)
 
 
+class AsyncOSINTSearcher:
+    """
+    asyncio front end to OSINTSearcher, multiplexing probes over HTTP/2
+    
+    Wraps a sync OSINTSearcher (available as .searcher for results, export
+    and cache settings) and sends its probes through one shared httpx client.
+    Use as an async context manager so the client is closed:
+    
+        async with AsyncOSINTSearcher() as searcher:
+            results = await searcher.search_username('john_doe')
+    
+    Falls back to the threaded requests path when httpx is not installed,
+    and to HTTP/1.1 when the h2 package is missing.
+    """
+    
+    def __init__(self, verify_ssl=True, cache_client=None, cache_ttl=3600, searcher=None):
+        """
+        Initialize the wrapped searcher and the shared httpx client
+        
+        Args:
+            verify_ssl: Verify TLS certificates
+            cache_client: Optional redis.Redis-compatible client
+            cache_ttl: Cache entry lifetime in seconds
+            searcher: Existing OSINTSearcher to wrap instead of creating one
+                from the arguments above
+        """
+        if searcher is None:
+            searcher = OSINTSearcher(
+                verify_ssl=verify_ssl, cache_client=cache_client, cache_ttl=cache_ttl
+            )
+        self.searcher = searcher
+        self._closed = False
+        self._client = None
+        if httpx is not None:
+            client_args = {
+                'limits': httpx.Limits(max_keepalive_connections=32),
+                'headers': {'User-Agent': searcher.session.headers['User-Agent']},
+                'verify': searcher.verify_ssl,
+                'follow_redirects': True
+            }
+            try:
+                self._client = httpx.AsyncClient(http2=True, **client_args)
+            except ImportError:  # http2=True needs the h2 package
+                self._client = httpx.AsyncClient(**client_args)
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    async def aclose(self):
+        """Close the httpx client and the wrapped searcher"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self.searcher.close()
+        self._closed = True
+    
+    async def _fetch_raw(self, url: str, timeout: int, parse: str,
+                         include_headers: bool) -> tuple:
+        """
+        Perform one GET over the shared httpx client, raising on failure
+        
+        Returns:
+            Tuple of (status code, body or None, header items or None)
+        """
+        logger.info("Requesting: %s", url)
+        async with self._client.stream('GET', url, timeout=timeout) as response:
+            if parse == 'none' and self.searcher._should_drain(response.headers.get('Content-Length')):
+                await response.aread()
+            response.raise_for_status()
+            if parse == 'json':
+                body = await response.aread()
+            elif parse == 'text':
+                await response.aread()
+                body = response.text
+            else:
+                body = None
+            headers = tuple(response.headers.items()) if include_headers else None
+            return response.status_code, body, headers
+    
+    async def search_username(self, username: str) -> Dict[str, Any]:
+        """
+        Search for username across multiple platforms
+        
+        Args:
+            username: Username to search
+            
+        Returns:
+            Dictionary with platform presence information
+        """
+        if self._closed:
+            raise RuntimeError("AsyncOSINTSearcher is closed")
+        searcher = self.searcher
+        logger.info("Searching for username: %s", username)
+        platforms = searcher._username_platforms(username)
+        if self._client is not None:
+            responses = await searcher._probe_platforms(
+                self._fetch_raw, platforms, parse='none', include_headers=False
+            )
+        else:
+            loop = asyncio.get_running_loop()
+            responses = await loop.run_in_executor(None, partial(
+                searcher._probe_threaded, platforms, parse='none', include_headers=False
+            ))
+        return searcher._username_results(username, platforms, responses)
+
 def main():
     """Main entry point for CLI"""
+    # Configure logging here rather than at import so embedding is side-effect free
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+    
     parser = argparse.ArgumentParser(
         description='OSINTAAM - Open Source Intelligence Analysis & Analytics Machine',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -302,23 +935,23 @@ Examples:
     
     try:
         if args.command == 'email':
-            logger.info(f"Starting email search for: {args.target}")
+            logger.info("Starting email search for: %s", args.target)
             searcher.results = searcher.search_email_breach(args.target)
             
         elif args.command == 'username':
-            logger.info(f"Starting username search for: {args.target}")
+            logger.info("Starting username search for: %s", args.target)
             searcher.results = searcher.search_username(args.target)
             
         elif args.command == 'domain':
-            logger.info(f"Starting domain search for: {args.target}")
+            logger.info("Starting domain search for: %s", args.target)
             searcher.results = searcher.search_domain_info(args.target)
             
         elif args.command == 'phone':
-            logger.info(f"Starting phone search for: {args.target}")
+            logger.info("Starting phone search for: %s", args.target)
             searcher.results = searcher.search_phone_breach(args.target)
             
         elif args.command == 'tor':
-            logger.info(f"Starting Tor monitoring for: {args.query}")
+            logger.info("Starting Tor monitoring for: %s", args.query)
             searcher.results = searcher.search_tor_monitoring(args.query)
         
         # Display results
@@ -335,8 +968,10 @@ Examples:
         logger.warning("Search interrupted by user")
         sys.exit(1)
     except Exception as e:
-        logger.error(f"Error during search: {str(e)}")
+        logger.error("Error during search: %s", e)
         sys.exit(1)
+    finally:
+        searcher.close()
 
 
 if __name__ == '__main__':
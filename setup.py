@@ -5,6 +5,13 @@ setup(
     version='0.1.0',
     packages=find_packages(),
     install_requires=[],  # List of dependencies
+    extras_require={
+        'async': ['aiohttp', 'aiodns'],
+        'cache': ['redis'],
+        'speedups': ['orjson'],
+        'jit': ['numba'],
+        'http2': ['httpx[http2]'],
+    },
     entry_points={
         'console_scripts': [],  # List of console scripts
     },
@@ -18,5 +25,5 @@ setup(
         'License :: OSI Approved :: MIT License',
         'Operating System :: OS Independent',
     ],
-    python_requires='>=3.6',
+    python_requires='>=3.7',
 )
\ No newline at end of file
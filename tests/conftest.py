@@ -0,0 +1,67 @@
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+# main.py is a top-level script, not an installed package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+
+
+class LocalServer:
+    """Keep-alive HTTP/1.1 server: paths under /missing/ answer 404, others 200"""
+
+    def __init__(self):
+        self.paths = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                server.paths.append(self.path)
+                body = b'{"login": "octocat"}'
+                self.send_response(404 if self.path.startswith('/missing/') else 200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.base = 'http://127.0.0.1:%d' % self._httpd.server_address[1]
+        threading.Thread(
+            target=self._httpd.serve_forever, kwargs={'poll_interval': 0.01}, daemon=True
+        ).start()
+
+    def url(self, path):
+        return self.base + path
+
+    def close(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture
+def local_server():
+    server = LocalServer()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def local_searcher(local_server):
+    """OSINTSearcher subclass probing one found and one missing local platform"""
+
+    class LocalSearcher(main.OSINTSearcher):
+        PLATFORM_TEMPLATES = (
+            ('found', local_server.url('/users/{}')),
+            ('missing', local_server.url('/missing/{}')),
+        )
+
+    return LocalSearcher
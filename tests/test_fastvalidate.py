@@ -0,0 +1,20 @@
+import fastvalidate
+
+CANDIDATES = [
+    'a', 'a-b', 'A1-2-3', 'x' * 39,
+    '', '-a', 'a-', 'a--b', 'x' * 40, 'ab_c', 'a.b', 'jö', '用户',
+]
+VALID = ['a', 'a-b', 'A1-2-3', 'x' * 39]
+
+
+def test_filter_usernames_keeps_valid_in_order():
+    assert fastvalidate.filter_usernames(CANDIDATES) == VALID
+
+
+def test_filter_usernames_matches_regex_fallback():
+    regex = [n for n in CANDIDATES if fastvalidate._GITHUB_USERNAME_RE.fullmatch(n)]
+    assert fastvalidate.filter_usernames(CANDIDATES) == regex
+
+
+def test_filter_usernames_empty():
+    assert fastvalidate.filter_usernames([]) == []
@@ -0,0 +1,353 @@
+import asyncio
+import gc
+import json
+import time
+import warnings
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+
+import pytest
+from urllib3.exceptions import InsecureRequestWarning
+
+import main
+from main import OSINTSearcher, _compile_url_builder
+
+USERNAMES = [
+    'john_doe',
+    'a/b?c#d&e=f',
+    '../admin',
+    '100%',
+    'jöhn dœ',
+    '用户',
+    '',
+]
+
+
+@pytest.mark.parametrize('platform,template', OSINTSearcher.PLATFORM_TEMPLATES)
+@pytest.mark.parametrize('username', USERNAMES)
+def test_url_builder_matches_format(platform, template, username):
+    quoted = quote(username, safe='')
+    assert _compile_url_builder(template)(quoted) == template.format(quoted)
+
+
+@pytest.mark.parametrize('username', USERNAMES)
+def test_username_platforms_match_templates(username):
+    searcher = OSINTSearcher()
+    quoted = quote(username, safe='')
+    expected = {
+        platform: template.format(quoted)
+        for platform, template in OSINTSearcher.PLATFORM_TEMPLATES
+    }
+    assert searcher._username_platforms(username) == expected
+    searcher.close()
+
+
+@pytest.mark.parametrize('template', [
+    'https://example.com/{}/{}',
+    'https://example.com/users',
+])
+def test_url_builder_rejects_bad_templates(template):
+    with pytest.raises(ValueError):
+        _compile_url_builder(template)
+
+
+def test_search_username_with_no_platforms():
+    class NoPlatforms(OSINTSearcher):
+        PLATFORM_TEMPLATES = ()
+
+    searcher = NoPlatforms()
+    assert searcher._probe_threaded({}) == {}
+    assert searcher.search_username('john_doe')['platforms'] == {}
+    searcher.close()
+
+
+def _assert_local_results(results, username):
+    assert results['username'] == username
+    assert results['platforms']['found']['found'] is True
+    assert results['platforms']['found']['status_code'] == 200
+    assert results['platforms']['missing'] == {'found': False, 'error': 'HTTP Error'}
+
+
+@pytest.mark.skipif(main.aiohttp is None, reason='aiohttp not installed')
+def test_search_username_shared_between_threads(local_searcher):
+    searcher = local_searcher()
+    names = ['alice', 'bob', 'carol', 'dave']
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        with ThreadPoolExecutor(max_workers=len(names)) as ex:
+            results = list(ex.map(searcher.search_username, names))
+        gc.collect()
+    for name, result in zip(names, results):
+        _assert_local_results(result, name)
+    assert not [w for w in caught if 'never awaited' in str(w.message)]
+    searcher.close()
+
+
+def test_dropped_searcher_leaves_nothing_open(local_searcher):
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        searcher = local_searcher()
+        _assert_local_results(searcher.search_username('alice'), 'alice')
+        del searcher
+        gc.collect()
+    assert not [w for w in caught if 'Unclosed' in str(w.message)]
+
+
+@pytest.mark.parametrize('fmt', ['json', 'txt'])
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_export_error_result(local_server, tmp_path, monkeypatch, fmt, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(main, 'orjson', None)
+    elif main.orjson is None:
+        pytest.skip('orjson not installed')
+    searcher = OSINTSearcher()
+    error = searcher.safe_request(local_server.url('/missing/x'))
+    assert error is main._ERR_HTTP
+    searcher.results = {'probe': error}
+
+    exported = searcher.export_results(fmt)
+    assert '"error": "HTTP Error"' in exported
+
+    path = tmp_path / ('results.' + fmt)
+    searcher.save_results(str(path), fmt)
+    assert path.read_text(encoding='utf-8') == exported
+    searcher.close()
+
+
+def test_json_default_rejects_unknown_types():
+    with pytest.raises(TypeError):
+        main._json_dumps({'bad': object()})
+
+
+@pytest.mark.parametrize('use_aiohttp', [True, False])
+def test_search_username_memoizes_successes(local_server, local_searcher,
+                                            monkeypatch, use_aiohttp):
+    if not use_aiohttp:
+        monkeypatch.setattr(main, 'aiohttp', None)
+    elif main.aiohttp is None:
+        pytest.skip('aiohttp not installed')
+    searcher = local_searcher()
+    first = searcher.search_username('alice')
+    second = searcher.search_username('alice')
+    assert first['platforms'] == second['platforms']
+    # Successes are served from the memo; errors are always retried
+    assert local_server.paths.count('/users/alice') == 1
+    assert local_server.paths.count('/missing/alice') == 2
+    searcher.close()
+
+
+def test_safe_request_shares_memo_with_search(local_server, local_searcher):
+    searcher = local_searcher()
+    searcher.safe_request(local_server.url('/users/alice'), parse='none')
+    searcher.search_username('alice')
+    assert local_server.paths.count('/users/alice') == 1
+    searcher.close()
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis.Redis get/setex subset"""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+        self.ttls[key] = ttl
+
+
+class BrokenRedis:
+    def get(self, key):
+        raise ConnectionError('redis down')
+
+    def setex(self, key, ttl, value):
+        raise ConnectionError('redis down')
+
+
+def test_cache_round_trip_is_compressed_json():
+    cache = FakeRedis()
+    searcher = OSINTSearcher(cache_client=cache, cache_ttl=120)
+    response = {'status': 'success', 'code': 200, 'content': 'jöhn'}
+    searcher._cache_store('https://example.com/a', response, parse='text')
+
+    key = searcher._cache_key('https://example.com/a', parse='text')
+    assert key.startswith(OSINTSearcher.CACHE_PREFIX)
+    assert json.loads(zlib.decompress(cache.data[key])) == response
+    assert cache.ttls[key] == 120
+    assert searcher._cache_load('https://example.com/a', parse='text') == response
+    searcher.close()
+
+
+def test_cache_key_depends_on_request_options():
+    searcher = OSINTSearcher(cache_client=FakeRedis())
+    url = 'https://example.com/a'
+    keys = {
+        searcher._cache_key(url, parse='text', include_headers=False),
+        searcher._cache_key(url, parse='json', include_headers=False),
+        searcher._cache_key(url, parse='none', include_headers=False),
+        searcher._cache_key(url, parse='none', include_headers=True),
+        searcher._cache_key('https://example.com/b', parse='none', include_headers=False),
+    }
+    assert len(keys) == 5
+    searcher.close()
+
+
+def test_cached_get_never_stores_errors(local_server):
+    cache = FakeRedis()
+    searcher = OSINTSearcher(cache_client=cache)
+    response = searcher._cached_get(local_server.url('/missing/x'), parse='none')
+    assert response['status'] == 'error'
+    assert cache.data == {}
+    searcher.close()
+
+
+def test_cache_failures_fall_back_to_network(local_server):
+    searcher = OSINTSearcher(cache_client=BrokenRedis())
+    response = searcher._cached_get(local_server.url('/users/alice'), parse='json')
+    assert response['status'] == 'success'
+    assert response['content'] == {'login': 'octocat'}
+    assert local_server.paths == ['/users/alice']
+    searcher.close()
+
+
+@pytest.mark.parametrize('use_aiohttp', [True, False])
+def test_search_username_served_from_cache(local_server, local_searcher,
+                                           monkeypatch, use_aiohttp):
+    if not use_aiohttp:
+        monkeypatch.setattr(main, 'aiohttp', None)
+    elif main.aiohttp is None:
+        pytest.skip('aiohttp not installed')
+    cache = FakeRedis()
+    first = local_searcher(cache_client=cache)
+    expected = first.search_username('alice')
+    first.close()
+    assert len(cache.data) == 1  # only the found platform
+
+    # A fresh searcher has an empty memo, so hits must come from the cache
+    second = local_searcher(cache_client=cache)
+    assert second.search_username('alice')['platforms'] == expected['platforms']
+    assert local_server.paths.count('/users/alice') == 1
+    assert local_server.paths.count('/missing/alice') == 2
+    second.close()
+
+
+@pytest.mark.parametrize('use_aiohttp', [True, False])
+def test_search_username_survives_broken_cache(local_searcher, monkeypatch, use_aiohttp):
+    if not use_aiohttp:
+        monkeypatch.setattr(main, 'aiohttp', None)
+    elif main.aiohttp is None:
+        pytest.skip('aiohttp not installed')
+    searcher = local_searcher(cache_client=BrokenRedis())
+    _assert_local_results(searcher.search_username('alice'), 'alice')
+    searcher.close()
+
+
+class _FakeResponse:
+    status_code = 200
+    headers = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+    def raise_for_status(self):
+        pass
+
+
+def _unverified_searcher():
+    """Searcher whose GETs emit urllib3's warning like an unverified HTTPS call"""
+    searcher = OSINTSearcher(verify_ssl=False)
+
+    def fake_get(url, **kwargs):
+        time.sleep(0.001)
+        warnings.warn('Unverified HTTPS request', InsecureRequestWarning)
+        return _FakeResponse()
+
+    searcher.session.get = fake_get
+    return searcher
+
+
+def _fetch_concurrently(searcher, count=200, workers=16):
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        list(ex.map(
+            lambda i: searcher._fetch('https://example.com/%d' % i, 10, 'none', False),
+            range(count)
+        ))
+
+
+def test_insecure_warning_suppression_is_thread_safe():
+    searcher = _unverified_searcher()
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        before = list(warnings.filters)
+        _fetch_concurrently(searcher)
+        assert warnings.filters == before
+        assert not [w for w in caught if issubclass(w.category, InsecureRequestWarning)]
+
+        # Outside an unverified request the warning is visible again
+        warnings.warn('Unverified HTTPS request', InsecureRequestWarning)
+        assert [w for w in caught if issubclass(w.category, InsecureRequestWarning)]
+    searcher.close()
+
+
+def test_insecure_warning_suppression_keeps_caller_filter():
+    searcher = _unverified_searcher()
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', category=InsecureRequestWarning)
+        before = list(warnings.filters)
+        _fetch_concurrently(searcher)
+        assert warnings.filters == before
+        assert main._INSECURE_FILTER in warnings.filters
+    searcher.close()
+
+
+def test_async_searcher_wraps_rather_than_subclasses():
+    assert not issubclass(main.AsyncOSINTSearcher, OSINTSearcher)
+
+
+@pytest.mark.skipif(main.httpx is None, reason='httpx not installed')
+def test_async_searcher_httpx_path(local_server, local_searcher):
+    async def run():
+        async with main.AsyncOSINTSearcher(searcher=local_searcher()) as searcher:
+            assert searcher._client is not None
+            results = await asyncio.gather(*[
+                searcher.search_username(name) for name in ('alice', 'bob')
+            ])
+            repeat = await searcher.search_username('alice')
+        return searcher, results, repeat
+
+    searcher, (alice, bob), repeat = asyncio.run(run())
+    _assert_local_results(alice, 'alice')
+    _assert_local_results(bob, 'bob')
+    assert repeat['platforms'] == alice['platforms']
+    assert local_server.paths.count('/users/alice') == 1
+    assert searcher._client is None
+
+
+def test_async_searcher_without_httpx(local_server, local_searcher, monkeypatch):
+    monkeypatch.setattr(main, 'httpx', None)
+
+    async def run():
+        async with main.AsyncOSINTSearcher(searcher=local_searcher()) as searcher:
+            assert searcher._client is None
+            return await searcher.search_username('alice')
+
+    _assert_local_results(asyncio.run(run()), 'alice')
+    assert local_server.paths.count('/users/alice') == 1
+
+
+def test_async_searcher_refuses_use_after_aclose(local_searcher):
+    async def run():
+        searcher = main.AsyncOSINTSearcher(searcher=local_searcher())
+        await searcher.aclose()
+        assert searcher._client is None
+        with pytest.raises(RuntimeError):
+            await searcher.search_username('alice')
+
+    asyncio.run(run())